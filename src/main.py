@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime, date
 import asyncio
 
-from summonsscraper.database import get_all_cases, get_queries, init_database, save_case, save_query, update_case_user_status
+from summonsscraper.database import get_all_cases, get_queries, init_database, save_cases, save_query, update_case_user_status
 from summonsscraper.model import Case, Query, SearchQuery
 
 
@@ -410,10 +410,13 @@ def query_status_page():
                     for search in query.searches
                 ]
 
-                for case in sample_cases:
-                    save_case(case)
+                counts = save_cases(sample_cases)
 
-                st.success(f"Loaded {len(sample_cases)} sample cases")
+                st.success(
+                    f"Loaded {len(sample_cases)} sample cases "
+                    f"({counts['new']} new, {counts['changed']} changed, "
+                    f"{counts['unchanged']} unchanged)"
+                )
                 st.rerun()
 
 def get_editing_index()-> int: 
@@ -1,7 +1,8 @@
 import sqlite3
 import json
+import hashlib
 from datetime import datetime
-from typing import List
+from typing import Dict, List
 import os
 
 from summonsscraper.model import Case, Query, SearchQuery
@@ -40,10 +41,26 @@ def init_database():
                 other TEXT NOT NULL,
                 query_id TEXT NOT NULL,
                 user_status TEXT,
+                content_hash TEXT,
                 FOREIGN KEY (query_id) REFERENCES queries (id)
             )
         """)
 
+        # Add content_hash to databases created before it existed
+        cursor.execute("PRAGMA table_info(cases)")
+        if "content_hash" not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute("ALTER TABLE cases ADD COLUMN content_hash TEXT")
+
+            # Backfill hashes so existing rows compare as unchanged on re-scrape
+            cursor.execute("SELECT * FROM cases")
+            cursor.executemany(
+                "UPDATE cases SET content_hash = ? WHERE caseId = ?",
+                [
+                    (case_content_hash(case), case.caseId)
+                    for case in map(row_to_case, cursor.fetchall())
+                ],
+            )
+
         conn.commit()
 
 
@@ -69,31 +86,124 @@ def save_query(query: Query):
         conn.commit()
 
 
-def save_case(case: Case):
+def case_content_hash(case: Case) -> str:
+    """Hash the scraped content of a case.
+
+    `loaded` and `query_id` describe when/how the case was fetched rather than
+    the case itself, and `user_status` belongs to the operator, so all three
+    are left out.
+    """
+    content = json.dumps(
+        [
+            case.caseId,
+            case.business,
+            case.filingDate.isoformat(),
+            case.defendant,
+            case.caseName,
+            case.caseStatus,
+            case.addresses,
+            case.other,
+        ],
+        sort_keys=True,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def save_cases(cases: List[Case]) -> Dict[str, int]:
+    """Upsert scraped cases, skipping rows whose content has not changed.
+
+    Only scraper-owned columns are written on conflict, so `user_status` is
+    preserved. Returns counts of new, changed and unchanged cases.
+
+    Unchanged cases are not written at all, so their `query_id` and `loaded`
+    are those of the last write that changed their content.
+    """
+    counts = {"new": 0, "changed": 0, "unchanged": 0}
     with sqlite3.connect(CASES_DB) as conn:
         cursor = conn.cursor()
-        cursor.execute(
+        rows = []
+        # Hashes of cases already seen in this batch, so repeated caseIds
+        # (e.g. from overlapping search windows) are compared against the
+        # earlier copy rather than the not-yet-written table
+        batch_hashes: Dict[str, str] = {}
+        for case in cases:
+            content_hash = case_content_hash(case)
+            if case.caseId in batch_hashes:
+                existing = (batch_hashes[case.caseId],)
+            else:
+                cursor.execute(
+                    "SELECT content_hash FROM cases WHERE caseId = ?", (case.caseId,)
+                )
+                existing = cursor.fetchone()
+            batch_hashes[case.caseId] = content_hash
+            if existing is None:
+                counts["new"] += 1
+            elif existing[0] == content_hash:
+                counts["unchanged"] += 1
+                continue
+            else:
+                counts["changed"] += 1
+            rows.append(
+                (
+                    case.caseId,
+                    case.business,
+                    case.filingDate.isoformat(),
+                    case.defendant,
+                    case.caseName,
+                    case.loaded.isoformat(),
+                    case.caseStatus,
+                    json.dumps(case.addresses),
+                    json.dumps(case.other),
+                    case.query_id,
+                    case.user_status,
+                    content_hash,
+                )
+            )
+
+        cursor.executemany(
             """
-            INSERT OR REPLACE INTO cases 
-            (caseId, business, filingDate, defendant, caseName, loaded, caseStatus, addresses, other, query_id, user_status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            INSERT INTO cases 
+            (caseId, business, filingDate, defendant, caseName, loaded, caseStatus, addresses, other, query_id, user_status, content_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(caseId) DO UPDATE SET
+                business = excluded.business,
+                filingDate = excluded.filingDate,
+                defendant = excluded.defendant,
+                caseName = excluded.caseName,
+                loaded = excluded.loaded,
+                caseStatus = excluded.caseStatus,
+                addresses = excluded.addresses,
+                other = excluded.other,
+                query_id = excluded.query_id,
+                content_hash = excluded.content_hash
+            WHERE cases.content_hash IS NOT excluded.content_hash
         """,
-            (
-                case.caseId,
-                case.business,
-                case.filingDate.isoformat(),
-                case.defendant,
-                case.caseName,
-                case.loaded.isoformat(),
-                case.caseStatus,
-                json.dumps(case.addresses),
-                json.dumps(case.other),
-                case.query_id,
-                case.user_status,
-            ),
+            rows,
         )
         conn.commit()
 
+    return counts
+
+
+def save_case(case: Case) -> Dict[str, int]:
+    return save_cases([case])
+
+
+def row_to_case(row) -> Case:
+    return Case(
+        caseId=row[0],
+        business=row[1],
+        filingDate=datetime.fromisoformat(row[2]).date(),
+        defendant=row[3],
+        caseName=row[4],
+        loaded=datetime.fromisoformat(row[5]).date(),
+        caseStatus=row[6],
+        addresses=json.loads(row[7]),
+        other=json.loads(row[8]),
+        query_id=row[9],
+        user_status=row[10],
+    )
+
 
 def get_all_cases() -> List[Case]:
     with sqlite3.connect(CASES_DB) as conn:
@@ -101,25 +211,7 @@ def get_all_cases() -> List[Case]:
         cursor.execute("SELECT * FROM cases")
         rows = cursor.fetchall()
 
-    cases = []
-    for row in rows:
-        cases.append(
-            Case(
-                caseId=row[0],
-                business=row[1],
-                filingDate=datetime.fromisoformat(row[2]).date(),
-                defendant=row[3],
-                caseName=row[4],
-                loaded=datetime.fromisoformat(row[5]).date(),
-                caseStatus=row[6],
-                addresses=json.loads(row[7]),
-                other=json.loads(row[8]),
-                query_id=row[9],
-                user_status=row[10],
-            )
-        )
-
-    return cases
+    return [row_to_case(row) for row in rows]
 
 
 def get_queries() -> List[Query]:
@@ -0,0 +1,130 @@
+import json
+import sqlite3
+from datetime import date
+
+import pytest
+
+from summonsscraper import database
+from summonsscraper.model import Case
+
+
+@pytest.fixture
+def cases_db(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "case_data.db")
+    monkeypatch.setattr(database, "CASES_DB", db_path)
+    database.init_database()
+    return db_path
+
+
+@pytest.fixture
+def case():
+    return Case(
+        caseId="CASE_1",
+        business="Acme LLC",
+        filingDate=date(2024, 1, 2),
+        defendant="John Doe",
+        caseName="Acme LLC v. John Doe",
+        caseStatus="Active",
+        addresses=["123 Main St"],
+        query_id="query_1",
+    )
+
+
+def fetch_row(db_path, case_id):
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT * FROM cases WHERE caseId = ?", (case_id,))
+        return cursor.fetchone()
+
+
+def test_first_save_counts_as_new(cases_db, case):
+    counts = database.save_cases([case])
+
+    assert counts == {"new": 1, "changed": 0, "unchanged": 0}
+    assert fetch_row(cases_db, case.caseId) is not None
+
+
+def test_identical_resave_is_unchanged_and_not_written(cases_db, case):
+    database.save_cases([case])
+    row_before = fetch_row(cases_db, case.caseId)
+
+    counts = database.save_cases(
+        [case.model_copy(update={"query_id": "query_2", "loaded": date(2030, 1, 1)})]
+    )
+
+    assert counts == {"new": 0, "changed": 0, "unchanged": 1}
+    assert fetch_row(cases_db, case.caseId) == row_before
+
+
+def test_changed_status_is_updated_and_keeps_user_status(cases_db, case):
+    database.save_cases([case])
+    database.update_case_user_status(case.caseId, "sent")
+
+    counts = database.save_cases([case.model_copy(update={"caseStatus": "Closed"})])
+
+    assert counts == {"new": 0, "changed": 1, "unchanged": 0}
+    saved = {c.caseId: c for c in database.get_all_cases()}[case.caseId]
+    assert saved.caseStatus == "Closed"
+    assert saved.user_status == "sent"
+
+
+def test_repeated_case_id_in_batch_is_counted_once(cases_db, case):
+    changed_case = case.model_copy(update={"caseStatus": "Closed"})
+
+    counts = database.save_cases([case, case, changed_case])
+
+    assert counts == {"new": 1, "changed": 1, "unchanged": 1}
+    assert [c.caseStatus for c in database.get_all_cases()] == ["Closed"]
+
+
+def test_init_database_adds_content_hash_to_existing_table(
+    tmp_path, monkeypatch, case
+):
+    db_path = str(tmp_path / "case_data.db")
+    monkeypatch.setattr(database, "CASES_DB", db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE cases (
+                caseId TEXT PRIMARY KEY,
+                business TEXT NOT NULL,
+                filingDate TEXT NOT NULL,
+                defendant TEXT NOT NULL,
+                caseName TEXT,
+                loaded TEXT NOT NULL,
+                caseStatus TEXT NOT NULL,
+                addresses TEXT NOT NULL,
+                other TEXT NOT NULL,
+                query_id TEXT NOT NULL,
+                user_status TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO cases VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                case.caseId,
+                case.business,
+                case.filingDate.isoformat(),
+                case.defendant,
+                case.caseName,
+                "2024-01-03",
+                case.caseStatus,
+                json.dumps(case.addresses),
+                json.dumps(case.other),
+                "legacy_query",
+                "sent",
+            ),
+        )
+
+    database.init_database()
+    database.init_database()
+    row_before = fetch_row(db_path, case.caseId)
+    counts = database.save_cases([case])
+
+    with sqlite3.connect(db_path) as conn:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(cases)")]
+    assert columns.count("content_hash") == 1
+    assert counts == {"new": 0, "changed": 0, "unchanged": 1}
+    assert fetch_row(db_path, case.caseId) == row_before
+    saved = database.get_all_cases()[0]
+    assert (saved.query_id, saved.user_status) == ("legacy_query", "sent")
+    assert saved.loaded == date(2024, 1, 3)